@@ -1,12 +1,13 @@
 import socket
 import threading
-import json
 import math
 import time
 import signal
 import sys
 import logging
-from typing import Dict, Any
+import queue
+import selectors
+from typing import Dict, Any, List
 from collections import deque
 
 from pythontuio import TuioClient, TuioListener
@@ -14,11 +15,15 @@ from pythontuio import TuioClient, TuioListener
 import cv2
 import mediapipe as mp
 import numpy as np
+import orjson
 
 # CONFIG
 TUIO_ADDR = ("0.0.0.0", 3333)
 TCP_HOST = "127.0.0.1"
 TCP_PORT = 8765
+CAPTURE_SIZE = (320, 240)  # MediaPipe Hands works fine at this resolution
+SHOW_PREVIEW = False  # Camera preview window for debugging; drawn on its own thread
+PREVIEW_SIZE = (640, 480)  # Overlay coordinates below are laid out for this size
 
 # TUIO SYMBOLS
 ROTATE_SYMBOL = 0  # ID 0 for rotation
@@ -36,43 +41,102 @@ MEDICATION_SYMBOLS = {
     6: "Atorvastatin",
 }
 
+MEDICATION_NAMES = tuple(MEDICATION_SYMBOLS.values())  # Wheel sector -> medication name
+
 NUM_WHEEL_SECTORS = len(MEDICATION_SYMBOLS)
+INV_TAU_TIMES_N = NUM_WHEEL_SECTORS / math.tau  # Radians -> wheel sector
+SELECT_DIST_SQ = 0.08 * 0.08  # Max squared distance between a wheel and its confirm marker
+HOVER_MIN_INTERVAL = 1 / 60  # Max ~60 hover updates/sec while the sector is unchanged
 
 # Global variables
-clients = []
+clients: Dict[socket.socket, queue.Queue] = {}  # socket -> outbound queue drained by its writer thread
 clients_lock = threading.Lock()
-latest_objects: Dict[int, Dict[str, Any]] = {}
-latest_objects_lock = threading.Lock()
+CLIENT_QUEUE_SIZE = 256  # Slow clients drop their oldest messages beyond this
+
+# Tracked TUIO objects, sharded by session_id so each update only locks one stripe
+NUM_STRIPES = 8  # Must be a power of two
+stripes: List[Dict[int, Dict[str, Any]]] = [{} for _ in range(NUM_STRIPES)]  # session_id -> record
+stripe_symbols: List[Dict[int, Dict[int, Dict[str, Any]]]] = [{} for _ in range(NUM_STRIPES)]  # symbol_id -> {session_id: record}
+stripe_locks = [threading.Lock() for _ in range(NUM_STRIPES)]
+
 running = True
 
+# Last emitted hover per wheel: (sector, monotonic time)
+_last_hover = {'patient': (None, 0.0), 'nurse': (None, 0.0)}
+
 # Gesture detection control
-gesture_detection_enabled = False
-gesture_detection_lock = threading.Lock()
+gesture_detection_event = threading.Event()  # Set while gesture detection is enabled
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# Per-thread queue of encoded messages waiting to be flushed as one batch
+_pending = threading.local()
+
+
+def _pending_broadcasts():
+    if not hasattr(_pending, "messages"):
+        _pending.messages = []
+        _pending.batching = False
+    return _pending
+
+
+def _round_floats(obj: Dict[str, Any]) -> Dict[str, Any]:
+    # Sub-millimetre jitter is invisible on screen, so don't send it
+    rounded = {}
+    for key, value in obj.items():
+        if isinstance(value, float):
+            value = round(value, 3)
+        elif isinstance(value, dict):
+            value = _round_floats(value)
+        rounded[key] = value
+    return rounded
+
+
 def broadcast(obj: Dict[str, Any]):
-    data = (json.dumps(obj) + "\n").encode("utf-8")
+    msg_type = obj.get('type', 'unknown')
+    payload = orjson.dumps(_round_floats(obj))
+
+    pending = _pending_broadcasts()
+    pending.messages.append((msg_type, payload))
+
+    # Outside of a batch (e.g. gesture thread) send straight away
+    if not pending.batching:
+        flush_broadcasts()
+
+
+def flush_broadcasts():
+    pending = _pending_broadcasts()
+    if not pending.messages:
+        return
+
+    types = [msg_type for msg_type, _ in pending.messages]
+    data = b"\n".join(payload for _, payload in pending.messages) + b"\n"
+    pending.messages = []
+
+    # Hand off to each client's writer thread so a slow client never blocks the caller
     with clients_lock:
-        dead = []
-        sent_count = 0
-        for client_socket in clients:
+        outboxes = tuple(clients.values())
+
+    for outbox in outboxes:
+        _enqueue_drop_oldest(outbox, data)
+
+    if outboxes:
+        logger.info(f"✓ Queued {', '.join(repr(t) for t in types)} for {len(outboxes)} client(s)")
+
+
+def _enqueue_drop_oldest(outbox: queue.Queue, data: bytes):
+    while True:
+        try:
+            outbox.put_nowait(data)
+            return
+        except queue.Full:
             try:
-                client_socket.sendall(data)
-                sent_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to send to client: {e}")
-                dead.append(client_socket)
-        for dead_client in dead:
-            clients.remove(dead_client)
-        
-        if sent_count > 0:
-            logger.info(f"✓ Sent '{obj.get('type', 'unknown')}' to {sent_count} client(s)")
-        elif len(clients) > 0:
-            logger.warning(f"⚠ Could not send to any of {len(clients)} clients")
+                outbox.get_nowait()
+            except queue.Empty:
+                pass
 
 
 # TUIO LISTENER IMPLEMENTATION
@@ -93,6 +157,9 @@ class MyTuioListener(TuioListener):
         pass
 
     def _handle_obj(self, event_type, obj):
+        # Collect everything produced for this TUIO event and send it in one go
+        pending = _pending_broadcasts()
+        pending.batching = True
         try:
             symbol_id = None
 
@@ -121,16 +188,46 @@ class MyTuioListener(TuioListener):
                 "angle": angle,
             }
 
-            with latest_objects_lock:
+            stripe = (session_id or 0) & (NUM_STRIPES - 1)
+            with stripe_locks[stripe]:
                 if event_type in ("add", "update"):
-                    latest_objects[session_id] = record
+                    stripes[stripe][session_id] = record
+                    stripe_symbols[stripe].setdefault(symbol_id, {})[session_id] = record
                 else:
-                    latest_objects.pop(session_id, None)
+                    stripes[stripe].pop(session_id, None)
+                    same_symbol = stripe_symbols[stripe].get(symbol_id)
+                    if same_symbol is not None:
+                        same_symbol.pop(session_id, None)
+                        if not same_symbol:
+                            del stripe_symbols[stripe][symbol_id]
 
             process_logic_and_broadcast(record)
 
         except Exception as e:
             logger.error(f"Error handling TUIO object: {e}")
+        finally:
+            pending.batching = False
+            flush_broadcasts()
+
+
+def objects_with_symbol(symbol_id: int) -> List[Dict[str, Any]]:
+    # Records are replaced, never mutated, so the snapshot is safe to use unlocked
+    found = []
+    for lock, by_symbol in zip(stripe_locks, stripe_symbols):
+        with lock:
+            same_symbol = by_symbol.get(symbol_id)
+            if same_symbol:
+                found.extend(same_symbol.values())
+    return found
+
+
+def _should_emit_hover(wheel: str, sector: int) -> bool:
+    now = time.monotonic()
+    prev_sector, prev_t = _last_hover[wheel]
+    if sector == prev_sector and now - prev_t < HOVER_MIN_INTERVAL:
+        return False
+    _last_hover[wheel] = (sector, now)
+    return True
 
 
 def process_logic_and_broadcast(record: Dict[str, Any]):
@@ -141,140 +238,143 @@ def process_logic_and_broadcast(record: Dict[str, Any]):
 
     # WHEEL LOGIC - PATIENT MODE
     if sid == ROTATE_SYMBOL and evt == "add":
+        _last_hover['patient'] = (None, 0.0)
         broadcast({"type": "wheel_open", "x": record["x"], "y": record["y"], "marker": "patient"})
 
     if sid == ROTATE_SYMBOL and evt in ("add", "update"):
         # Calculate wheel sector based on rotation angle
-        theta = record["angle"] % (2 * math.pi)
-        frac = theta / (2 * math.pi)
-        sector = int(frac * NUM_WHEEL_SECTORS) % NUM_WHEEL_SECTORS
+        theta = record["angle"] % math.tau
+        sector = int(theta * INV_TAU_TIMES_N) % NUM_WHEEL_SECTORS
 
         # Get medication name for this sector
-        medication_name = list(MEDICATION_SYMBOLS.values())[sector]
-
-        broadcast({
-            "type": "wheel_hover",
-            "sector": sector,
-            "angle": theta,
-            "x": record["x"],
-            "y": record["y"],
-            "medication": medication_name,
-            "marker": "patient"
-        })
+        medication_name = MEDICATION_NAMES[sector]
+
+        if _should_emit_hover('patient', sector):
+            broadcast({
+                "type": "wheel_hover",
+                "sector": sector,
+                "angle": theta,
+                "x": record["x"],
+                "y": record["y"],
+                "medication": medication_name,
+                "marker": "patient"
+            })
 
         # SELECTION LOGIC
-        with latest_objects_lock:
-            for session_id, srec in list(latest_objects.items()):
-                if srec["symbol_id"] == SELECT_SYMBOL:
-                    dx = srec["x"] - record["x"]
-                    dy = srec["y"] - record["y"]
-                    dist = math.hypot(dx, dy)
-                    if dist < 0.08:
-                        selected_med = list(MEDICATION_SYMBOLS.values())[sector]
-                        broadcast({
-                            "type": "wheel_select_confirm",
-                            "sector": sector,
-                            "medication": selected_med,
-                            "marker": "patient"
-                        })
+        for srec in objects_with_symbol(SELECT_SYMBOL):
+            dx = srec["x"] - record["x"]
+            dy = srec["y"] - record["y"]
+            if dx * dx + dy * dy < SELECT_DIST_SQ:
+                selected_med = MEDICATION_NAMES[sector]
+                broadcast({
+                    "type": "wheel_select_confirm",
+                    "sector": sector,
+                    "medication": selected_med,
+                    "marker": "patient"
+                })
 
     # WHEEL LOGIC - NURSE MODE
     if sid == NURSE_MODE_SYMBOL and evt == "add":
+        _last_hover['nurse'] = (None, 0.0)
         broadcast({"type": "nurse_wheel_open", "x": record["x"], "y": record["y"]})
 
     if sid == NURSE_MODE_SYMBOL and evt in ("add", "update"):
         # Calculate wheel sector based on rotation angle (same as patient mode)
-        theta = record["angle"] % (2 * math.pi)
-        frac = theta / (2 * math.pi)
-        sector = int(frac * NUM_WHEEL_SECTORS) % NUM_WHEEL_SECTORS
+        theta = record["angle"] % math.tau
+        sector = int(theta * INV_TAU_TIMES_N) % NUM_WHEEL_SECTORS
 
         # Get medication name for this sector
-        medication_name = list(MEDICATION_SYMBOLS.values())[sector]
+        medication_name = MEDICATION_NAMES[sector]
 
-        broadcast({
-            "type": "nurse_wheel_hover",
-            "sector": sector,
-            "angle": theta,
-            "x": record["x"],
-            "y": record["y"],
-            "medication": medication_name
-        })
+        if _should_emit_hover('nurse', sector):
+            broadcast({
+                "type": "nurse_wheel_hover",
+                "sector": sector,
+                "angle": theta,
+                "x": record["x"],
+                "y": record["y"],
+                "medication": medication_name
+            })
 
         # SELECTION LOGIC
-        with latest_objects_lock:
-            for session_id, srec in list(latest_objects.items()):
-                # PATIENT SELECTION LOGIC
-                if srec["symbol_id"] == VIEW_PATIENT_INFO_SYMBOL:
-                    dx = srec["x"] - record["x"]
-                    dy = srec["y"] - record["y"]
-                    dist = math.hypot(dx, dy)
-                    if dist < 0.08:
-                        selected_item = list(MEDICATION_SYMBOLS.values())[sector]
-                        broadcast({
-                            "type": "nurse_wheel_select_confirm",
-                            "sector": sector,
-                            "item": selected_item
-                        })
-                
-                # MEDICATION SELECTION LOGIC
-                elif srec["symbol_id"] == EDIT_MEDICATIONS_SYMBOL:
-                    dx = srec["x"] - record["x"]
-                    dy = srec["y"] - record["y"]
-                    dist = math.hypot(dx, dy)
-                    if dist < 0.08:
-                        selected_med = list(MEDICATION_SYMBOLS.values())[sector]
-                        broadcast({
-                            "type": "nurse_edit_med_select",
-                            "sector": sector,
-                            "medication": selected_med
-                        })
+        # PATIENT SELECTION LOGIC
+        for srec in objects_with_symbol(VIEW_PATIENT_INFO_SYMBOL):
+            dx = srec["x"] - record["x"]
+            dy = srec["y"] - record["y"]
+            if dx * dx + dy * dy < SELECT_DIST_SQ:
+                selected_item = MEDICATION_NAMES[sector]
+                broadcast({
+                    "type": "nurse_wheel_select_confirm",
+                    "sector": sector,
+                    "item": selected_item
+                })
+
+        # MEDICATION SELECTION LOGIC
+        for srec in objects_with_symbol(EDIT_MEDICATIONS_SYMBOL):
+            dx = srec["x"] - record["x"]
+            dy = srec["y"] - record["y"]
+            if dx * dx + dy * dy < SELECT_DIST_SQ:
+                selected_med = MEDICATION_NAMES[sector]
+                broadcast({
+                    "type": "nurse_edit_med_select",
+                    "sector": sector,
+                    "medication": selected_med
+                })
 
     # BACK LOGIC
     if sid == BACK_SYMBOL and evt == "add":
         # Disable gesture detection when exiting
-        global gesture_detection_enabled
-        with gesture_detection_lock:
-            gesture_detection_enabled = False
+        gesture_detection_event.clear()
         broadcast({"type": "back_pressed"})
 
     # GESTURE DETECTION LOGIC - EDIT MEDICATIONS MODE
     if sid == EDIT_MEDICATIONS_SYMBOL and evt == "add":
         # NURSE MODE LOGIC
         marker13_nearby = False
-        with latest_objects_lock:
-            for session_id, srec in list(latest_objects.items()):
-                if srec["symbol_id"] == NURSE_MODE_SYMBOL:
-                    dx = srec["x"] - record["x"]
-                    dy = srec["y"] - record["y"]
-                    dist = math.hypot(dx, dy)
-                    if dist < 0.08:
-                        marker13_nearby = True
-                        break
-        
+        for srec in objects_with_symbol(NURSE_MODE_SYMBOL):
+            dx = srec["x"] - record["x"]
+            dy = srec["y"] - record["y"]
+            if dx * dx + dy * dy < SELECT_DIST_SQ:
+                marker13_nearby = True
+                break
+
         # TOGGLE GESTURE DETECTION
         if not marker13_nearby:
-            with gesture_detection_lock:
-                gesture_detection_enabled = True
+            gesture_detection_event.set()
             broadcast({
                 "type": "gesture_mode_toggled",
-                "enabled": gesture_detection_enabled
+                "enabled": gesture_detection_event.is_set()
             })
 
 
 # GESTURE RECOGNITION (MediaPipe and $1)
+FINGERTIP_LANDMARKS = [4, 8, 12, 16, 20]  # Thumb, index, middle, ring, pinky tips
+
+
 class Point:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
 
 class DollarRecognizer:
+    __slots__ = ('num_points', 'last_gesture_time', 'points', 'template_names', 'templates')
+
+    # Resampled templates shared by all recognizers: num_points -> (names, (T, N, 2) array)
+    _template_cache = {}
+
     def __init__(self, num_points=64):
         self.num_points = num_points
         self.last_gesture_time = 0
         self.points = []
-        self.templates = self._create_templates()
+        self.template_names, self.templates = self._create_templates()
         
     def _create_templates(self):
+        cached = DollarRecognizer._template_cache.get(self.num_points)
+        if cached is not None:
+            return cached
+
         templates = {}
         
         # LEFT SWIPE TEMPLATE
@@ -285,52 +385,29 @@ class DollarRecognizer:
         right_points = [Point(i/10.0, 0.5) for i in range(11)]
         templates['right'] = self._resample(right_points, self.num_points)
         
-        return templates
+        cached = (tuple(templates), np.stack(list(templates.values())))
+        DollarRecognizer._template_cache[self.num_points] = cached
+        return cached
     
-    def _resample(self, points, n):
-        if len(points) < 2:
+    def _to_array(self, points):
+        if isinstance(points, np.ndarray):
             return points
-            
-        interval = self._path_length(points) / (n - 1)
-        d = 0
-        new_points = [points[0]]
-        
-        i = 1
-        while i < len(points):
-            d1 = self._distance(points[i-1], points[i])
-            if (d + d1) >= interval:
-                qx = points[i-1].x + ((interval - d) / d1) * (points[i].x - points[i-1].x)
-                qy = points[i-1].y + ((interval - d) / d1) * (points[i].y - points[i-1].y)
-                q = Point(qx, qy)
-                new_points.append(q)
-                points.insert(i, q)
-                d = 0
-            else:
-                d += d1
-            i += 1
-        
-        if len(new_points) == n - 1:
-            new_points.append(points[-1])
-            
-        return new_points
-    
-    def _path_length(self, points):
-        length = 0
-        for i in range(1, len(points)):
-            length += self._distance(points[i-1], points[i])
-        return length
-    
-    def _distance(self, p1, p2):
-        return math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
+        coords = np.fromiter((c for p in points for c in (p.x, p.y)), dtype=np.float64, count=2 * len(points))
+        return coords.reshape(-1, 2)
+
+    def _resample(self, points, n):
+        pts = self._to_array(points)
+        if len(pts) < 2:
+            return pts
+
+        # Place n points evenly along the arc length of the path
+        seg_lengths = np.linalg.norm(np.diff(pts, axis=0), axis=1)
+        arc = np.concatenate(([0.0], np.cumsum(seg_lengths)))
+        if arc[-1] == 0:
+            return None  # A stationary hand has no path to resample
+        targets = np.linspace(0.0, arc[-1], n)
+        return np.column_stack((np.interp(targets, arc, pts[:, 0]), np.interp(targets, arc, pts[:, 1])))
     
-    def _path_distance(self, pts1, pts2):
-        if len(pts1) != len(pts2):
-            return float('inf')
-        d = 0
-        for i in range(len(pts1)):
-            d += self._distance(pts1[i], pts2[i])
-        return d / len(pts1)
-        
     def recognize(self):
         if len(self.points) < 5:
             return None
@@ -338,17 +415,15 @@ class DollarRecognizer:
         # Resample the input gesture
         points = self._resample(self.points, self.num_points)
         
-        # Find the best matching template
-        best_score = float('inf')
-        best_gesture = None
-        scores = {}
+        if points is None or points.shape != self.templates.shape[1:]:
+            return None
         
-        for name, template in self.templates.items():
-            distance = self._path_distance(points, template)
-            scores[name] = distance
-            if distance < best_score:
-                best_score = distance
-                best_gesture = name
+        # Score against every template at once and pick the best match
+        distances = np.linalg.norm(points[None, :, :] - self.templates, axis=2).mean(axis=1)
+        best = int(distances.argmin())
+        best_score = float(distances[best])
+        best_gesture = self.template_names[best]
+        scores = dict(zip(self.template_names, distances))
         
         logger.info(f"  Scores - Left: {scores['left']:.3f}, Right: {scores['right']:.3f}, Best: {best_gesture} ({best_score:.3f})")
         
@@ -363,31 +438,104 @@ class DollarRecognizer:
         return None
 
 
+def preview_thread(preview_queue: queue.Queue):
+    mp_hands = mp.solutions.hands
+    mp_drawing = mp.solutions.drawing_utils
+
+    while running:
+        try:
+            item = preview_queue.get(timeout=0.5)
+        except queue.Empty:
+            continue
+
+        # None means the camera was closed
+        if item is None:
+            cv2.destroyAllWindows()
+            continue
+
+        frame, overlays = item
+
+        # Scaled up so the overlay layout is unchanged
+        image = cv2.resize(frame, PREVIEW_SIZE)
+
+        # Landmarks are in camera space, so draw them before mirroring the preview
+        for hand_landmarks, _, _, _ in overlays:
+            mp_drawing.draw_landmarks(
+                image, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+        image = cv2.flip(image, 1)
+
+        for _, hand_x, time_str, is_closing in overlays:
+            # Add visual feedback - show current time
+            time_color = (0, 255, 0) if not is_closing else (0, 165, 255)  # Green or Orange
+            cv2.putText(image, f"TIME: {time_str}", (150, 80), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 2, time_color, 4)
+            cv2.putText(image, "Move LEFT to decrease, RIGHT to increase", (10, 30), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+            
+            # Add instruction for closing palm with visual feedback
+            if is_closing:
+                cv2.putText(image, f">>> CLOSING PALM - WILL SAVE! <<<", (10, 120), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 100, 255), 2)
+            else:
+                cv2.putText(image, f"Close palm to save & exit", (10, 120), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+            
+            # Draw position indicator bar
+            bar_y = 450
+            bar_width = 600
+            bar_x_start = 20
+            cv2.rectangle(image, (bar_x_start, bar_y - 10), (bar_x_start + bar_width, bar_y + 10), 
+                         (100, 100, 100), -1)
+            hand_pos_x = int(bar_x_start + hand_x * bar_width)
+            cv2.circle(image, (hand_pos_x, bar_y), 15, (0, 255, 255), -1)
+
+        # Show camera preview window
+        cv2.imshow('Hand Tracking - Time Adjustment (Close palm to save)', image)
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord('q'):
+            gesture_detection_event.clear()
+
+    cv2.destroyAllWindows()
+
+
 def hand_tracking_thread():
-    global running, gesture_detection_enabled
+    global running
     
     logger.info("Hand tracking with MediaPipe ready")
     
     try:
-        # Initialize MediaPipe Hands
+        # Initialize MediaPipe Hands once; loading the models is slow, so it
+        # stays alive across enable/disable cycles and only the camera is reopened
         mp_hands = mp.solutions.hands
-        mp_drawing = mp.solutions.drawing_utils
+        hands = mp_hands.Hands(
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+            max_num_hands=1
+        )
+        
+        # Drawing and imshow stay off this thread so they never delay inference
+        preview_queue = None
+        if SHOW_PREVIEW:
+            preview_queue = queue.Queue(maxsize=2)
+            threading.Thread(target=preview_thread, args=(preview_queue,), daemon=True).start()
         
         # Time adjustment tracking (continuous position-based control)
         base_time_minutes = 450  # Starting time: 7:30 AM = 450 minutes from midnight
         current_time_minutes = base_time_minutes
         last_broadcast_time = 0
-        broadcast_cooldown = 0.5  # Broadcast updates every 0.5 seconds
+        last_broadcast_minutes = None
+        broadcast_cooldown = 0.5  # Broadcast changed times at most every 0.5 seconds
+        broadcast_heartbeat = 2.0  # Re-send an unchanged time every 2 seconds
         
         cap = None
-        hands = None
         gesture_active = False
         frame_count = 0
+        stm = deque(maxlen=4)  # Short-term memory of recent (time, hand_x, avg_distance) samples
+        last_hand_landmarks = None
         
         while running:
             # Check if gesture detection is enabled
-            with gesture_detection_lock:
-                is_enabled = gesture_detection_enabled
+            is_enabled = gesture_detection_event.is_set()
             
             # If not enabled and camera is open, close it
             if not is_enabled:
@@ -406,10 +554,11 @@ def hand_tracking_thread():
                     
                     if cap is not None:
                         cap.release()
-                        cv2.destroyAllWindows()
                         cap = None
+                    if preview_queue is not None:
+                        _enqueue_drop_oldest(preview_queue, None)
                     gesture_active = False
-                time.sleep(0.1)
+                gesture_detection_event.wait(timeout=1.0)
                 continue
             
             # If enabled and camera is not open, open it
@@ -450,27 +599,22 @@ def hand_tracking_thread():
                     continue
                 
                 # Set camera properties
-                cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-                
-                # Initialize MediaPipe Hands
-                hands = mp_hands.Hands(
-                    min_detection_confidence=0.5,
-                    min_tracking_confidence=0.5,
-                    max_num_hands=1
-                )
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAPTURE_SIZE[0])
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAPTURE_SIZE[1])
                 
                 logger.info("✓ Hand tracking ACTIVE - move hand left/right to adjust time")
                 logger.info("  Close your palm (fist) to save and exit")
                 gesture_active = True
                 frame_count = 0
+                stm.clear()
                 
                 # Reset time when camera opens
                 base_time_minutes = 450  # 7:30 AM
                 current_time_minutes = base_time_minutes
+                last_broadcast_minutes = None
             
             # Process camera frames
-            if cap is not None and hands is not None:
+            if cap is not None:
                 success, image = cap.read()
                 if not success:
                     logger.warning("Failed to read frame, will retry...")
@@ -479,146 +623,123 @@ def hand_tracking_thread():
                 
                 frame_count += 1
                 
-                # Flip and convert image
-                image = cv2.flip(image, 1)
-                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                
-                # Process hand detection
-                results = hands.process(image_rgb)
-                
-                if results.multi_hand_landmarks:
-                    for hand_landmarks in results.multi_hand_landmarks:
-                        # Get wrist position (landmark 0) for X tracking
-                        wrist = hand_landmarks.landmark[0]
-                        hand_x = wrist.x  # 0.0 (left) to 1.0 (right)
-                        
-                        # Detect closed palm (fist gesture)
-                        # Compare fingertip distances to palm base
-                        thumb_tip = hand_landmarks.landmark[4]
-                        index_tip = hand_landmarks.landmark[8]
-                        middle_tip = hand_landmarks.landmark[12]
-                        ring_tip = hand_landmarks.landmark[16]
-                        pinky_tip = hand_landmarks.landmark[20]
-                        palm_base = hand_landmarks.landmark[0]  # wrist as reference
-                        
-                        # Calculate distances from fingertips to palm
-                        def distance_3d(p1, p2):
-                            return math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2 + (p1.z - p2.z)**2)
-                        
-                        thumb_dist = distance_3d(thumb_tip, palm_base)
-                        index_dist = distance_3d(index_tip, palm_base)
-                        middle_dist = distance_3d(middle_tip, palm_base)
-                        ring_dist = distance_3d(ring_tip, palm_base)
-                        pinky_dist = distance_3d(pinky_tip, palm_base)
-                        
-                        # Average distance - if all fingers are close to palm, it's a fist
-                        avg_distance = (thumb_dist + index_dist + middle_dist + ring_dist + pinky_dist) / 5
-                        is_fist = avg_distance < 0.15  # Threshold for closed palm
-                        is_closing = avg_distance < 0.20  # Getting close to closing
-                        
-                        if is_fist:
-                            logger.info("✓ CLOSED PALM detected - saving time and closing camera")
-                            
-                            # First, send the final time to C#
-                            hours = current_time_minutes // 60
-                            minutes = current_time_minutes % 60
-                            time_str = f"{hours:02d}:{minutes:02d}"
-                            logger.info(f"✓ Final time selected: {time_str}")
-                            
-                            # Check if clients are connected
-                            with clients_lock:
-                                client_count = len(clients)
-                            
-                            if client_count > 0:
-                                # Send final time
-                                broadcast({
-                                    "type": "gesture_time_final",
-                                    "time": time_str,
-                                    "minutes": current_time_minutes
-                                })
-                                
-                                time.sleep(0.2) 
-                                
-                                broadcast({
-                                    "type": "gesture_mode_toggled",
-                                    "enabled": False
-                                })
+                # Run inference on every other frame; in between, extrapolate from short-term memory
+                now = time.time()
+                hand_samples = []  # (hand_landmarks, hand_x, avg_distance)
+                if frame_count % 2 == 1 or len(stm) < 2:
+                    # Run on the unmirrored frame and mirror the landmarks instead; flipping
+                    # the pixels would cost a full extra copy of every frame
+                    image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+                    image_rgb.flags.writeable = False  # Lets MediaPipe use the buffer without copying
+                    
+                    # Process hand detection
+                    results = hands.process(image_rgb)
+                    
+                    if results.multi_hand_landmarks:
+                        for hand_landmarks in results.multi_hand_landmarks:
+                            # Get wrist position (landmark 0) for X tracking
+                            wrist = hand_landmarks.landmark[0]
+                            hand_x = 1.0 - wrist.x  # Mirrored: 0.0 (left) to 1.0 (right)
                             
-                            time.sleep(0.3)  # Give time for messages to send
+                            # Detect closed palm (fist gesture)
+                            # Compare fingertip distances to palm base (wrist as reference)
+                            landmarks = np.array(
+                                [[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark], dtype=np.float32)
+                            fingertip_dists = np.linalg.norm(landmarks[FINGERTIP_LANDMARKS] - landmarks[0], axis=1)
+
+                            # Average distance - if all fingers are close to palm, it's a fist
+                            avg_distance = float(fingertip_dists.mean())
                             
-                            with gesture_detection_lock:
-                                gesture_detection_enabled = False
-                            continue
-                        
-                        # Map hand position to time adjustment
-                        # Center (0.5) = base time, left = decrease, right = increase
-                        # Full range: left edge = -4 hours, right edge = +4 hours
-                        max_adjustment_minutes = 240  # ±4 hours
-                        time_offset = (hand_x - 0.5) * 2 * max_adjustment_minutes
-                        current_time_minutes = base_time_minutes + int(time_offset)
-                        
-                        # Keep time in valid 24-hour range
-                        current_time_minutes = max(0, min(1439, current_time_minutes))  # 0-1439 = 00:00-23:59
+                            stm.append((now, hand_x, avg_distance))
+                            last_hand_landmarks = hand_landmarks
+                            hand_samples.append((hand_landmarks, hand_x, avg_distance))
+                    else:
+                        stm.clear()
+                else:
+                    # Linear extrapolation of the wrist from the two most recent samples
+                    (t0, x0, _), (t1, x1, d1) = stm[-2], stm[-1]
+                    hand_x = x1 + (x1 - x0) * (now - t1) / (t1 - t0) if t1 > t0 else x1
+                    hand_x = max(0.0, min(1.0, hand_x))
+                    hand_samples.append((last_hand_landmarks, hand_x, d1))
+                
+                overlays = []  # (hand_landmarks, hand_x, time_str, is_closing) for the preview
+                for hand_landmarks, hand_x, avg_distance in hand_samples:
+                    is_fist = avg_distance < 0.15  # Threshold for closed palm
+                    is_closing = avg_distance < 0.20  # Getting close to closing
+                    
+                    if is_fist:
+                        logger.info("✓ CLOSED PALM detected - saving time and closing camera")
                         
-                        # Convert to hours and minutes for display
+                        # First, send the final time to C#
                         hours = current_time_minutes // 60
                         minutes = current_time_minutes % 60
                         time_str = f"{hours:02d}:{minutes:02d}"
+                        logger.info(f"✓ Final time selected: {time_str}")
+                        
+                        # Check if clients are connected
+                        with clients_lock:
+                            client_count = len(clients)
                         
-                        # Broadcast time updates periodically
-                        current_time = time.time()
-                        if current_time - last_broadcast_time >= broadcast_cooldown:
+                        if client_count > 0:
+                            # Send final time
                             broadcast({
-                                "type": "gesture_time_update",
+                                "type": "gesture_time_final",
                                 "time": time_str,
                                 "minutes": current_time_minutes
                             })
-                            last_broadcast_time = current_time
-                        
-                        # Draw hand landmarks
-                        mp_drawing.draw_landmarks(
-                            image, hand_landmarks, mp_hands.HAND_CONNECTIONS)
-                        
-                        # Add visual feedback - show current time
-                        time_color = (0, 255, 0) if not is_closing else (0, 165, 255)  # Green or Orange
-                        cv2.putText(image, f"TIME: {time_str}", (150, 80), 
-                                   cv2.FONT_HERSHEY_SIMPLEX, 2, time_color, 4)
-                        cv2.putText(image, "Move LEFT to decrease, RIGHT to increase", (10, 30), 
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+                            
+                            time.sleep(0.2) 
+                            
+                            broadcast({
+                                "type": "gesture_mode_toggled",
+                                "enabled": False
+                            })
                         
-                        # Add instruction for closing palm with visual feedback
-                        if is_closing:
-                            cv2.putText(image, f">>> CLOSING PALM - WILL SAVE! <<<", (10, 120), 
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 100, 255), 2)
-                        else:
-                            cv2.putText(image, f"Close palm to save & exit", (10, 120), 
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                        time.sleep(0.3)  # Give time for messages to send
                         
-                        # Draw position indicator bar
-                        bar_y = 450
-                        bar_width = 600
-                        bar_x_start = 20
-                        cv2.rectangle(image, (bar_x_start, bar_y - 10), (bar_x_start + bar_width, bar_y + 10), 
-                                     (100, 100, 100), -1)
-                        hand_pos_x = int(bar_x_start + hand_x * bar_width)
-                        cv2.circle(image, (hand_pos_x, bar_y), 15, (0, 255, 255), -1)
+                        gesture_detection_event.clear()
+                        continue
+                    
+                    # Map hand position to time adjustment
+                    # Center (0.5) = base time, left = decrease, right = increase
+                    # Full range: left edge = -4 hours, right edge = +4 hours
+                    max_adjustment_minutes = 240  # ±4 hours
+                    time_offset = (hand_x - 0.5) * 2 * max_adjustment_minutes
+                    current_time_minutes = base_time_minutes + int(time_offset)
+                    
+                    # Keep time in valid 24-hour range
+                    current_time_minutes = max(0, min(1439, current_time_minutes))  # 0-1439 = 00:00-23:59
+                    
+                    # Convert to hours and minutes for display
+                    hours = current_time_minutes // 60
+                    minutes = current_time_minutes % 60
+                    time_str = f"{hours:02d}:{minutes:02d}"
+                    
+                    # Broadcast time updates when the minute changes, plus a periodic heartbeat
+                    current_time = time.time()
+                    since_last = current_time - last_broadcast_time
+                    if ((current_time_minutes != last_broadcast_minutes and since_last >= broadcast_cooldown)
+                            or since_last > broadcast_heartbeat):
+                        broadcast({
+                            "type": "gesture_time_update",
+                            "time": time_str,
+                            "minutes": current_time_minutes
+                        })
+                        last_broadcast_time = current_time
+                        last_broadcast_minutes = current_time_minutes
+                    
+                    if preview_queue is not None:
+                        overlays.append((hand_landmarks, hand_x, time_str, is_closing))
                 
-                # Show camera preview window
-                cv2.imshow('Hand Tracking - Time Adjustment (Close palm to save)', image)
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    with gesture_detection_lock:
-                        gesture_detection_enabled = False
-                    continue
+                if preview_queue is not None:
+                    _enqueue_drop_oldest(preview_queue, (image, overlays))
                 
                 time.sleep(0.03)  # ~30 FPS
         
         # Cleanup
         if cap is not None:
             cap.release()
-        if hands is not None:
-            hands.close()
-        cv2.destroyAllWindows()
+        hands.close()
         
     except Exception as e:
         logger.error(f"✗ Error in hand tracking thread: {e}")
@@ -626,32 +747,65 @@ def hand_tracking_thread():
         traceback.print_exc()
 
 
-def client_reader_thread(conn: socket.socket, addr):
-    client_name = f"{addr[0]}:{addr[1]}"
-    logger.info(f"Client connected: {client_name}")
-
-    try:
-        conn.settimeout(0.5)
-        while running:
+def _send_chunks(conn: socket.socket, chunks: List[bytes]):
+    # sendmsg (POSIX only) hands every chunk to the kernel in one scatter-gather call
+    if not hasattr(conn, "sendmsg"):
+        conn.sendall(b"".join(chunks))
+        return
+
+    while chunks:
+        sent = conn.sendmsg(chunks)
+        # Drop what was fully written and trim a partially written chunk
+        while chunks and sent >= len(chunks[0]):
+            sent -= len(chunks[0])
+            chunks.pop(0)
+        if sent:
+            chunks[0] = chunks[0][sent:]
+
+
+def client_writer_thread(conn: socket.socket, outbox: queue.Queue):
+    stop = False
+    while running and not stop:
+        # Drain everything queued so far so it goes out in a single call
+        chunks = [outbox.get()]
+        while True:
             try:
-                data = conn.recv(1024)
-                if not data:
-                    break
-            except socket.timeout:
-                continue
-            except Exception:
+                chunks.append(outbox.get_nowait())
+            except queue.Empty:
                 break
-    except Exception as e:
-        logger.error(f"Error in client thread: {e}")
-    finally:
-        with clients_lock:
-            if conn in clients:
-                clients.remove(conn)
+        if None in chunks:
+            stop = True
+            chunks = [data for data in chunks if data is not None]
+        if not chunks:
+            continue
         try:
-            conn.close()
-        except:
-            pass
-        logger.info(f"Client disconnected: {client_name}")
+            _send_chunks(conn, chunks)
+        except Exception as e:
+            logger.warning(f"Failed to send to client: {e}")
+            # Wake the selector loop, which owns unregistering and closing the socket
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except:
+                pass
+            break
+
+
+def _disconnect_client(sel: selectors.BaseSelector, conn: socket.socket, client_name: str):
+    sel.unregister(conn)
+    with clients_lock:
+        outbox = clients.pop(conn, None)
+    if outbox is not None:
+        _enqueue_drop_oldest(outbox, None)  # Stop the writer thread
+    try:
+        conn.shutdown(socket.SHUT_RDWR)  # Wakes a writer blocked in send
+    except:
+        pass
+    try:
+        conn.close()
+    except:
+        pass
+    logger.info(f"Client disconnected: {client_name}")
+
 
 def tcp_acceptor(host: str, port: int):
     logger.info(f"Starting TCP server on {host}:{port}")
@@ -660,24 +814,58 @@ def tcp_acceptor(host: str, port: int):
     server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     server_sock.bind((host, port))
     server_sock.listen(8)
-    server_sock.settimeout(1.0)
+    server_sock.setblocking(False)
+
+    # One selector watches the listening socket and every client, instead of a reader thread per client
+    sel = selectors.DefaultSelector()
+    sel.register(server_sock, selectors.EVENT_READ)
 
     try:
         while running:
             try:
-                conn, addr = server_sock.accept()
-            except socket.timeout:
-                continue
-            except OSError:
+                events = sel.select(timeout=1.0)
+            except (OSError, ValueError):
                 break
 
-            with clients_lock:
-                clients.append(conn)
+            for key, _ in events:
+                if key.fileobj is server_sock:
+                    try:
+                        conn, addr = server_sock.accept()
+                    except BlockingIOError:
+                        continue
+
+                    client_name = f"{addr[0]}:{addr[1]}"
+                    logger.info(f"Client connected: {client_name}")
+
+                    outbox = queue.Queue(maxsize=CLIENT_QUEUE_SIZE)
+                    # Writers block on slow clients; their bounded queues drop frames meanwhile.
+                    # Set explicitly since sockets accepted from a non-blocking listener may inherit it
+                    conn.setblocking(True)
+                    # Messages are already batched, so don't let Nagle hold them back
+                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+                    with clients_lock:
+                        clients[conn] = outbox
+                    sel.register(conn, selectors.EVENT_READ, client_name)
+
+                    writer_thread = threading.Thread(target=client_writer_thread, args=(conn, outbox), daemon=True)
+                    writer_thread.start()
+                    continue
 
-            client_thread = threading.Thread(target=client_reader_thread, args=(conn, addr), daemon=True)
-            client_thread.start()
+                # Clients never send anything meaningful; reads only detect disconnects
+                conn = key.fileobj
+                try:
+                    data = conn.recv(1024)
+                except Exception:
+                    data = b""
+                if not data:
+                    _disconnect_client(sel, conn, key.data)
 
     finally:
+        for key in list(sel.get_map().values()):
+            if key.fileobj is not server_sock:
+                _disconnect_client(sel, key.fileobj, key.data)
+        sel.close()
         server_sock.close()
 
 